@@ -1,9 +1,10 @@
 '''
 A simple metronome app built using tkinter, with audio processing handled 
 using the sounddevice library. For a particular tempo, an array containing 
-one bar worth of samples is created and a generator is used to perpetually 
-supply chunks of samples to the sounddevice OutputStream via the callback 
-function. In this way, it acts like a sliding window over the one-bar array.
+one bar worth of samples is created and the OutputStream callback function 
+copies chunks of samples directly from it, using a read position that wraps 
+around at the end of the bar. In this way, it acts like a sliding window over 
+the one-bar array.
 
 A "drift error" accumulates over time as a result of representing one beat 
 using an integer number of samples, thus discarding the fractional component 
@@ -23,7 +24,7 @@ Example:
 
 The drift error introduced per beat is 0.6896 samples. Once the cumulative
 drift error exceeds 0.5 samples, the movement of the sliding window in the
-generator is adjusted to compensate and keep the cumulative error in the
+callback is adjusted to compensate and keep the cumulative error in the
 range [-0.5, 0.5] samples.
 
 Changing tempo during playback is supported and the position within the bar 
@@ -57,62 +58,121 @@ Problems to be solved:
 
 '''
 
+import argparse
+import os
 import queue
 import sys
 import threading
 import collections
 
-import librosa
+import soundfile as sf
 import sounddevice as sd
 import numpy as np
+from numba import njit
 
 import tkinter as tk
-from tkinter import Scale, Button, Frame, HORIZONTAL, DoubleVar
-from PIL import ImageTk, Image
+from tkinter import DoubleVar
 
 #%%
 
+@njit(nogil=True, cache=True)
+def _fill(outdata, bar_array_padded, samples_per_bar, pos, drift, drift_per_frame, drift_denom):
+    '''
+    Copy the next chunk of the one-bar array, starting at index pos, into
+    outdata and apply the drift correction. Compiled with numba so the
+    callback does not run this per-frame work in the interpreter, and the
+    GIL is released while it runs.
+    
+    bar_array_padded is the one-bar array followed by a copy of its first
+    BLOCKSIZE samples, so a chunk never needs to wrap around.
+    
+    The drift error is kept as an integer numerator over drift_denom, so
+    it is exact and does not accumulate rounding error over long runs.
+    
+    Returns the updated read position and accumulated drift error.
+    '''
+    frames = outdata.shape[0]
+    outdata[:, 0] = bar_array_padded[pos:pos + frames]
+    
+    # Advance the read position one sample less once the drift reaches 0.5
+    drift += drift_per_frame
+    correction = 0
+    if 2 * drift >= drift_denom:    # try to keep error in [-0.5, 0.5]
+        correction = 1
+        drift -= drift_denom
+    
+    return (pos + frames - correction) % samples_per_bar, drift
+
+
 class Metronome():
-    def __init__(self, master, tempo):
+    # Click samples, loaded once and shared between instances
+    _click_samples = None
+    
+    def __init__(self, master, tempo, low_latency=False):
         
-        self.running = False
+        # Set while the metronome is playing. The stream itself runs
+        # continuously and outputs silence while this is clear.
+        self._playing = threading.Event()
         self.fs = 16000
         
         # Define some constants related to audio playback
         self.BLOCKSIZE = 256    # samples per frame of audio
-        self.BUFFERSIZE = 40    # frames of audio to pre-fill queue with
-        self.MAXQUEUESIZE = 50
-        self.TIMEOUT = self.BLOCKSIZE * self.BUFFERSIZE / self.fs
+        # Halving the blocksize relies on the callback doing no more than an
+        # allocation-free copy from the bar array, so it can keep up
+        if low_latency and self.output_supports_low_latency(self.BLOCKSIZE // 2):
+            self.BLOCKSIZE //= 2
+        self.BARCACHESIZE = 64  # number of one-bar arrays to keep for reuse
+        self.TEMPODEBOUNCE = 100    # ms without tempo adjustments before applying them
         
-        self.tempo = tempo
-        self.q = queue.Queue(maxsize=self.MAXQUEUESIZE)
+        self.tempo = int(tempo)
         self.event = threading.Event()
+        # Guards self._pending_swap, through which a new bar array and read
+        # position are handed to the callback
+        self._swap_lock = threading.Lock()
+        self._pending_swap = None
+        # Messages from the callback, printed from the GUI thread so the
+        # callback never blocks on writing to the terminal
+        self._log_q = queue.SimpleQueue()
         
         # Set initial values for some metronome attributes
         self.beats_per_bar = 4
         self.samples_per_beat = None
         self.samples_per_bar = None
         self.get_seconds_per_bar()
-        # Arrays to build the one-bar array
-        self.zeros = None
-        self.accent_beat = None
-        self.non_accent_beat = None
         self.callback_frame_counter = 0
+        self.pos = 0    # read cursor into the one-bar array
+        # Previously built one-bar arrays, keyed by (tempo, beats_per_bar),
+        # in least to most recently used order
+        self._bar_cache = collections.OrderedDict()
         
         self.tempo_start_bar_fraction = 0.0    # fractional progress through a bar at start of a tempo
         self.bar_fraction_at_tempo_change = 0.0
         
-        # Drift error
-        self.accumulated_drift_error = 0.0
+        # Drift error, as a numerator over self.drift_denom samples
+        self.accumulated_drift_error = 0
+        
+        # Tempo waiting to be applied by self._flush_tempo, and the id of
+        # the scheduled tk after() call that will apply it
+        self._pending_tempo = None
+        self._flush_after_id = None
         
         # Call methods for setup
         # Load samples from file
         self.hi, self.lo = self.load_click_samples()
-        # Generate the bar and beat arrays
-        self.generate_bar_and_beat_array(self.tempo)
-        # Create a generator and an OutputStream
-        self.gen = self.sample_generator()
+        # Generate the one-bar array
+        self.generate_bar_array(self.tempo)
+        # Compile _fill now so the first audio callback doesn't stall on it
+        _fill(np.zeros((self.BLOCKSIZE, 1), dtype=np.float32), self.bar_array_padded,
+              self.samples_per_bar, 0, 0, self.drift_per_frame, self.drift_denom)
+        # State owned by the callback. Only replaced via self._pending_swap
+        # after this point.
+        self._bar = self.bar_array_padded
+        self._samples_per_bar = self.samples_per_bar
+        self._drift_per_frame = self.drift_per_frame
+        self._drift_denom = self.drift_denom
+        # Create an OutputStream and leave it running for the app's lifetime
         self.stream = self.create_stream()
+        self.stream.start()
         
         
         # Build the GUI components
@@ -126,56 +186,82 @@ class Metronome():
         self.build_slider_frame()
         self.tempo_slider.set(self.tempo)
         self.build_start_stop_frame()
+        self.master.after(100, self._drain_log)
         
         
     ### Methods to load samples and build audio arrays
     def load_click_samples(self):
-        hi, _ = librosa.load("./samples/hi.wav", sr=self.fs)
-        lo, _ = librosa.load("./samples/lo.wav", sr=self.fs)
-        return hi, lo
+        '''
+        Read the click samples as float32 (to match the OutputStream dtype).
+        The WAV files are stored at self.fs, so no resampling is needed.
+        '''
+        if Metronome._click_samples is None:
+            hi, hi_fs = sf.read("./samples/hi.wav", dtype='float32')
+            lo, lo_fs = sf.read("./samples/lo.wav", dtype='float32')
+            if hi_fs != self.fs or lo_fs != self.fs:
+                raise ValueError(f"Click samples must have a sample rate of {self.fs} Hz")
+            Metronome._click_samples = (hi, lo)
+        
+        return Metronome._click_samples
     
     
-    def generate_bar_and_beat_array(self, tempo):
-        self.samples_per_beat = int(self.fs * 60.0 / tempo)
+    def generate_bar_array(self, tempo):
+        # Integer and remainder parts of fs * 60 / tempo, i.e. the number of
+        # samples per beat is samples_per_beat + remainder / tempo
+        self.samples_per_beat, remainder = divmod(self.fs * 60, tempo)
         self.samples_per_bar = self.samples_per_beat * self.beats_per_bar
-        self.zeros = np.zeros(self.samples_per_beat - len(self.hi))
 
-        # Build arrays containing click sounds and the silence that follows
-        self.accent_beat = np.concatenate([self.hi, self.zeros])
-        self.non_accent_beat = np.concatenate([self.lo, self.zeros])
-
-        # Build one bar of audio samples and an array with the beat number at every sample
-        self.bar_array = np.concatenate([self.accent_beat, np.tile(self.non_accent_beat, self.beats_per_bar - 1)])
-        self.beat_array = np.array([1+divmod(i, self.samples_per_beat)[0] for i in range(self.samples_per_bar)])
-        
-    
-    def compute_drift_error_per_frame(self):
-        '''
-     
-        '''
-        
-        samples_per_beat, decimal_component = divmod(self.fs * 60.0 / self.tempo, 1)
-        error_per_sample = decimal_component / samples_per_beat
-        
-        return self.BLOCKSIZE * error_per_sample
+        # Reuse the bar from the cache if this tempo has been built before.
+        # The bar array is never modified once built, so it can be shared.
+        key = (tempo, self.beats_per_bar)
+        if key in self._bar_cache:
+            self._bar_cache.move_to_end(key)
+            self.bar_array_padded = self._bar_cache[key]
+        else:
+            # Leave room after the bar for a copy of its first BLOCKSIZE
+            # samples, so the callback can always read a contiguous chunk
+            self.bar_array_padded = np.empty(self.samples_per_bar + self.BLOCKSIZE, dtype=np.float32)
+            
+            # Build one bar of audio samples by filling a (beats, samples) view of
+            # a preallocated array with the click sounds and the silence that follows
+            bar_array = self.bar_array_padded[:self.samples_per_bar]
+            beats = bar_array.reshape((self.beats_per_bar, self.samples_per_beat))
+            if max(len(self.hi), len(self.lo)) > self.samples_per_beat:
+                raise ValueError(f"Click samples are longer than one beat at {tempo} bpm")
+            beats[0, :len(self.hi)] = self.hi
+            beats[0, len(self.hi):] = 0.0
+            beats[1:, :len(self.lo)] = self.lo
+            beats[1:, len(self.lo):] = 0.0
+            self.bar_array_padded[self.samples_per_bar:] = bar_array[:self.BLOCKSIZE]
+            
+            self._bar_cache[key] = self.bar_array_padded
+            if len(self._bar_cache) > self.BARCACHESIZE:
+                self._bar_cache.popitem(last=False)
+        
+        # The drift error per frame only depends on the tempo, so compute it
+        # here rather than on every frame in the audio thread. It is
+        # BLOCKSIZE * (remainder / tempo) / samples_per_beat samples, stored
+        # as an exact integer numerator over drift_denom.
+        self.drift_per_frame = self.BLOCKSIZE * remainder
+        self.drift_denom = tempo * self.samples_per_beat
     
     
     def get_seconds_per_bar(self):
         self.seconds_per_bar = self.beats_per_bar / (self.tempo / 60.0)
     
     
-    def reset_counters(self):
-        self.accumulated_drift_error = 0
-
-    
-    def apply_shift(self, shift_val):
+    def queue_bar_swap(self, pos):
         '''
-        Use np.roll to shift self.bar_array and self.beat_array together.
-        
+        Hand the current bar array, its drift error per frame and a starting
+        read position to the callback. The callback applies them together at
+        the start of its next frame and resets the accumulated drift error,
+        so it never sees a new bar with an old position. Building the bar
+        happens beforehand, so the lock is only held for the assignment.
         '''
-        self.bar_array = np.roll(self.bar_array, shift_val)
-        self.beat_array = np.roll(self.beat_array, shift_val)
-        
+        with self._swap_lock:
+            self._pending_swap = (self.bar_array_padded, self.samples_per_bar, pos,
+                                  self.drift_per_frame, self.drift_denom)
+
     
     def map_current_position_to_new_tempo_index(self):
         '''
@@ -208,54 +294,6 @@ class Metronome():
         return bar_index_at_new_tempo
         
     
-    def sample_generator(self):
-        '''
-        When given an array equivalent to one bar of click audio, yield
-        the chunks of samples that will be passed to the sounddevice
-        OutputStream instance. The arrays yielded from this generator will
-        be assigned to "outdata" in the callback function referred to by
-        OutputStream.        
-        '''
-        
-        # Reset this counter each time a new generator instance is created
-        self.accumulated_drift_error = 0
-        # For the first output from the generator, yield the first set of samples
-        yield self.bar_array[0:self.BLOCKSIZE], self.beat_array[0:self.BLOCKSIZE]
-        
-        frame_drift_error = self.compute_drift_error_per_frame()
-        self.accumulated_drift_error += frame_drift_error
-        
-        # After yielding the initial set of samples, we yield further
-        # chunks of samples indefinitely, from a generator instance
-        while True:
-            # Account for drift by adjusting roll value
-            # Check if we need to roll the array to mitigate drift error
-            if self.accumulated_drift_error >= 0.5:    # try to keep error in [-0.5, 0.5]
-                # Get the integer part of the accumulated drift error  (or use 1 if [-0.5, 0.5])
-                int_accumulated_drift_error = 1#int(self.accumulated_drift_error)
-                # Adjust the accumulated_drift_error value to account for correction
-                self.accumulated_drift_error -= int_accumulated_drift_error
-                
-                # This (self.samples_to_roll is just for debugging / testing)
-                #self.samples_to_roll += int_accumulated_drift_error
-                #print(self.samples_to_roll)
-                
-                roll_value = self.BLOCKSIZE - int_accumulated_drift_error
-                
-            else:
-                roll_value = self.BLOCKSIZE
-            
-            
-            # Shift the array by the required number of samples
-            self.apply_shift(-roll_value)
-            yield self.bar_array[0:self.BLOCKSIZE], self.beat_array[0:self.BLOCKSIZE]
-            
-            # Update accumulated drift error after each frame that is yielded
-            frame_drift_error = self.compute_drift_error_per_frame()
-            self.accumulated_drift_error += frame_drift_error
-            #print(self.accumulated_drift_error)
-            
-            
     def set_tempo(self, tempo):
         '''
         Set the instance attribute self.tempo to a new value.
@@ -271,7 +309,7 @@ class Metronome():
         '''
         
         # Store the time that the old tempo ended, if currently running
-        if self.running:
+        if self._playing.is_set():
             self.tempo_end_time = self.stream.time
             self.time_at_tempo = self.tempo_end_time - self.tempo_start_time
             print(f"Time spent at tempo: {self.time_at_tempo:.3f} seconds")
@@ -284,22 +322,19 @@ class Metronome():
         # Set the tempo instance attribute so the updated value is accessible by everything else
         self.tempo = int(tempo)
         
-        # Reset accumulated drift error
-        self.reset_counters()
-        
-        # Generate the bar and beat arrays
-        self.generate_bar_and_beat_array(self.tempo)
+        # Generate the one-bar array
+        self.generate_bar_array(self.tempo)
         
-        if self.running:
-            # Map to correct position in new bar and perform the shift using np.roll
+        if self._playing.is_set():
+            # Map to correct position in new bar and move the read cursor there
             new_bar_index = self.map_current_position_to_new_tempo_index()
             # Add some print statements for debugging
             print(f"The starting index in the new bar is {new_bar_index}")
-            # Shift the newly generated bar and beat arrays to start at new_bar_idx
-            self.apply_shift(-new_bar_index)
+        else:
+            new_bar_index = 0
         
-        # Create a new queue and fill it with new tempo samples
-        self.create_and_fill_new_queue()
+        # Swap in the new bar and position (this also resets the drift error)
+        self.queue_bar_swap(new_bar_index)
         
         # Record the time at which the new tempo started
         self.tempo_start_time = self.stream.time
@@ -319,47 +354,71 @@ class Metronome():
         buttons for +/- 5 bpm and +/- 10 bpm.
         
         Check for adjustment causing the tempo to go out of range of the 
-        tk.Scale self.tempo_scale. If out of range, pass the slider limit to
-        self.set_tempo() to adjust self.tempo as well as the GUI components.
+        tk.Scale self.tempo_scale. If out of range, use the slider limit.
+        
+        The slider is updated straight away, but self.set_tempo() is only
+        called once no further adjustment has arrived for TEMPODEBOUNCE ms.
+        This is longer than the key auto-repeat interval, so holding down an
+        arrow key results in a single call to self.set_tempo() when the key
+        is released.
         
         '''
         
-        if self.tempo + tempo_adjustment < int(self.tempo_slider.cget("from")):
-            self.set_tempo(int(self.tempo_slider.cget("from")))
+        if self._pending_tempo is None:
+            self._pending_tempo = self.tempo
+        self._pending_tempo += tempo_adjustment
         
-        elif self.tempo + tempo_adjustment > int(self.tempo_slider.cget("to")):
-            self.set_tempo(int(self.tempo_slider.cget("to")))
-   
-        else:
-            self.set_tempo(self.tempo + tempo_adjustment)
+        if self._pending_tempo < int(self.tempo_slider.cget("from")):
+            self._pending_tempo = int(self.tempo_slider.cget("from"))
+        
+        elif self._pending_tempo > int(self.tempo_slider.cget("to")):
+            self._pending_tempo = int(self.tempo_slider.cget("to"))
+        
+        self.tempo_scale_var.set(self._pending_tempo)
+        
+        # Restart the wait each time another adjustment arrives
+        if self._flush_after_id is not None:
+            self.master.after_cancel(self._flush_after_id)
+        self._flush_after_id = self.master.after(self.TEMPODEBOUNCE, self._flush_tempo)
+    
+    
+    def _flush_tempo(self):
+        '''
+        Apply the tempo accumulated by self.adjust_tempo().
+        '''
+        
+        tempo = self._pending_tempo
+        self._pending_tempo = None
+        self._flush_after_id = None
+        
+        self.set_tempo(tempo)
+    
+    
+    def _cancel_pending_tempo(self):
+        '''
+        Discard any tempo adjustment still waiting to be applied by
+        self._flush_tempo(), so it can't overwrite a tempo set directly.
+        '''
+        
+        if self._flush_after_id is not None:
+            self.master.after_cancel(self._flush_after_id)
+        self._pending_tempo = None
+        self._flush_after_id = None
     
     
     def update_tempo_on_mouse_click_release(self, event):
+        self._cancel_pending_tempo()
         self.set_tempo(self.tempo_slider.get())
 
 
     ### Methods for audio playback
-    def create_and_fill_new_queue(self):
-        # Create empty queue and pre-fill it
-        self.q = queue.Queue(maxsize=self.MAXQUEUESIZE)
-        
-        # Create a temporary generator to fill the queue. This avoids
-        # the problem where the generator is already being executed in
-        # self.callback
-        temp_gen = self.sample_generator()
-        
-        # Get data from the generator and add it to queue
-        for _ in range(self.BUFFERSIZE):
-            data = next(temp_gen)
-            if not len(data):
-                break
-            self.q.put_nowait(data)
-            
-        # Once the temporary generator is no longer being used to fill the queue,
-        # replace self.gen with this temporary generator
-        self.gen = temp_gen
-        
-        #print("\nFINISHED PRE-FILLING QUEUE\n")
+    def output_supports_low_latency(self, blocksize):
+        '''
+        Check whether the default output device reports a low output latency
+        no longer than the duration of one frame of the given blocksize.
+        '''
+        device = sd.query_devices(kind='output')
+        return device['default_low_output_latency'] <= blocksize / self.fs
     
     
     def create_stream(self):        
@@ -367,81 +426,97 @@ class Metronome():
         return sd.OutputStream(samplerate=self.fs,
                                      blocksize=self.BLOCKSIZE,
                                      channels=1,
+                                     dtype='float32',
+                                     latency='low',
                                      callback=self.callback,
                                      finished_callback=self.event.set)
     
     
     def callback(self, outdata, frames, time, status):
-        #print("In Callback:", self.q.qsize())
-        assert frames == self.BLOCKSIZE
-        
-        if status.output_underflow:
-            print('Output underflow: increase blocksize?', file=sys.stderr)
-            raise sd.CallbackAbort
-        assert not status
-        
-        try:
-            # Get the next data from the queue
-            bar_data, beat_data = self.q.get_nowait()
-        except queue.Empty as e:
-            print('Buffer is empty: increase buffersize?', file=sys.stderr)
-            raise sd.CallbackAbort from e
-        
-        if len(bar_data) < len(outdata):
-            outdata[:len(bar_data)] = bar_data.reshape((-1,1))
-            outdata[len(bar_data):].fill(0)
-            raise sd.CallbackStop
-        else:
-            # Add the next data to the end of the queue
+        # Report problems (e.g. output underflow) without stopping the stream
+        if status:
+            self._log_q.put_nowait(str(status))
+        
+        if not self._playing.is_set():
+            outdata.fill(0)
+            return
+        
+        # The padded bar can only supply BLOCKSIZE samples past its end, so
+        # pad any larger frame with silence (the stream's fixed blocksize
+        # means this shouldn't happen)
+        if frames > self.BLOCKSIZE:
+            outdata[self.BLOCKSIZE:].fill(0)
+            outdata = outdata[:self.BLOCKSIZE]
+        
+        # Only take the lock when a new bar has been handed over
+        if self._pending_swap is not None:
+            with self._swap_lock:
+                (self._bar, self._samples_per_bar, self.pos,
+                 self._drift_per_frame, self._drift_denom) = self._pending_swap
+                self._pending_swap = None
+            self.accumulated_drift_error = 0
+        
+        self.pos, self.accumulated_drift_error = _fill(outdata, self._bar, self._samples_per_bar,
+                                                       self.pos, self.accumulated_drift_error,
+                                                       self._drift_per_frame, self._drift_denom)
+            
+
+    def _drain_log(self):
+        '''
+        Print any messages queued by the callback, then check again in 100 ms.
+        '''
+        while True:
             try:
-                data = next(self.gen)
-                self.q.put(data, timeout=self.TIMEOUT)
-                #print(self.q.qsize())
-                # Send the data to the OutputStream
-                outdata[:] = bar_data.reshape((-1,1))
-                                
-                # Debugging print statement - print out the current beat number
-                #print(collections.Counter(beat_data).most_common()[0][0])
-                #self.callback_frame_counter += 1
-            except Exception as e:
-                print(e)
+                msg = self._log_q.get_nowait()
+            except queue.Empty:
+                break
+            print(msg, file=sys.stderr)
+        
+        self.master.after(100, self._drain_log)
             
 
     ### Methods for metronome controls
     def start(self):
         # Prevent multiple starts
-        if self.running:
+        if self._playing.is_set():
             return
         else:
             print("Starting...")
-            self.running = True
             
             # Reset this because we want to go back to the beginning of a bar
             # each time we click start if the metronome is stopped
             self.tempo_start_bar_fraction = 0.0
             
-            # Create new bar/beat arrays and a new generator, so we start at the beginning of the bar
-            self.generate_bar_and_beat_array(self.tempo)
-            self.reset_counters()
-            self.gen = self.sample_generator()
-            self.create_and_fill_new_queue()
+            # Create a new bar array and rewind, so we start at the beginning of the bar
+            self.generate_bar_array(self.tempo)
+            self.queue_bar_swap(0)
             
             # Disable the beats per bar spinbox (for now)
             #self.time_signature_spinbox.config(state='disabled')
             
-            # Start the stream (stream created in __init__)
-            self.stream.start()
+            # The stream is started in __init__, but restart it if the
+            # callback has aborted it. PortAudio doesn't treat an aborted
+            # stream as stopped, so abort it properly before starting again.
+            if not self.stream.active:
+                try:
+                    self.stream.abort()
+                    self.stream.start()
+                except sd.PortAudioError as e:
+                    print(f"Could not restart the stream: {e}", file=sys.stderr)
+                    self._playing.clear()
+                    return
+            self._playing.set()
             # Take note of the time at which we started this particular tempo
             self.tempo_start_time = self.stream.time
             
             
     def stop(self):
-        if not self.running:
+        if not self._playing.is_set():
             return
         else:
             print("Stopping...")
-            self.running = False
-            self.stream.abort()     # ends the stream quicker than stream.stop()
+            # The callback outputs silence from its next frame
+            self._playing.clear()
             # Re-enable the beats per bar spinbox (disabled for now)
             #self.time_signature_spinbox.config(state='readonly')
     
@@ -451,7 +526,7 @@ class Metronome():
         Method to be bound to the space key so it can be used to start and stop
         the metronome.
         '''
-        if self.running:
+        if self._playing.is_set():
             self.stop()
         else:
             self.start()
@@ -525,7 +600,27 @@ class Metronome():
 
     
 
-root = tk.Tk()
-m = Metronome(master=root, tempo=170)
-root.mainloop()
+def raise_process_priority():
+    '''
+    Lower the niceness of the process so the audio callback is less likely
+    to be preempted by the GUI or other processes. This usually needs extra
+    privileges, and is not available on Windows, so failure is ignored.
+    '''
+    try:
+        os.nice(-10)
+    except (AttributeError, OSError):
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="A simple metronome app.")
+    parser.add_argument("--low-latency", action="store_true",
+                        help="halve the audio blocksize if the output device supports it")
+    args = parser.parse_args()
+    
+    raise_process_priority()
+    
+    root = tk.Tk()
+    m = Metronome(master=root, tempo=170, low_latency=args.low_latency)
+    root.mainloop()
 